@@ -3,8 +3,12 @@ VNG Data Analyzer - Streamlit Application
 Main entry point for the VNG data analysis tool
 """
 
+import io
+import numpy as np
 import streamlit as st
-from typing import Dict, List
+import plotly.io as pio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple, Any
 
 # New architecture imports
 from repositories.session_repository import SessionRepository
@@ -15,7 +19,23 @@ from config.ui_config import (
     APP_TITLE, APP_SUBTITLE, UPLOAD_INSTRUCTIONS, UPLOAD_HELP,
     ANALYZE_BUTTON_TEXT, APP_ICON, PAGE_LAYOUT, INITIAL_SIDEBAR_STATE
 )
+from config.constants import (
+    CHART_CACHE_MAX_ENTRIES, ANALYSIS_CACHE_MAX_ENTRIES, MAX_PARSE_WORKERS,
+    PARSER_VERSION, PARSE_CACHE_MAX_ENTRIES
+)
 from domain.exceptions import VNGError, ValidationError, ParsingError, FileError
+from domain.models import ParsedFile, AnalysisResults
+
+# UI components
+from ui.layouts.main_layout import apply_custom_styling
+from ui.components.file_upload import render_file_upload_section
+from ui.components.dashboard import render_summary_cards, render_quick_stats
+from ui.components.tables import render_enhanced_table
+from ui.components.charts import (
+    render_enhanced_line_chart, render_enhanced_bar_chart, render_radar_chart,
+    render_box_plot, render_correlation_matrix, render_multi_metric_comparison,
+    render_heatmap
+)
 
 # Legacy imports for backward compatibility
 from modules.visualizer import render_category_chart
@@ -32,10 +52,42 @@ st.set_page_config(
 SessionRepository.initialize()
 
 # Apply custom styling
-from ui.layouts.main_layout import apply_custom_styling
 apply_custom_styling()
 
 
+@st.cache_data(show_spinner=False, persist="disk", max_entries=PARSE_CACHE_MAX_ENTRIES)
+def _parse_cached(
+    file_name: str, file_digest: str, parser_version: int, _file_bytes: bytes
+) -> ParsedFile:
+    """
+    Validate and parse an uploaded file, cached on its name and content digest
+    
+    The raw bytes are not hashed by Streamlit (leading underscore); the xxh3
+    ``file_digest`` computed once per upload stands in for them.
+    Persisted to disk so parses survive server restarts; ``parser_version``
+    keeps entries written by an older parser from being served after an
+    upgrade. ``max_entries`` bounds only the in-memory copy: Streamlit never
+    evicts the on-disk files (nor applies ``ttl``), so the disk cache grows
+    until cleared with ``streamlit cache clear`` (see README). Analysis stays
+    memory-only since it depends on the combination of uploaded files.
+    """
+    size_bytes = len(_file_bytes)
+    FileService.validate_file(file_name, size_bytes)
+    # BytesIO shares the bytes buffer; parse_stream decodes it chunk by chunk
+    return ParsingService.parse_stream(file_name, io.BytesIO(_file_bytes), size_bytes)
+
+
+@st.cache_data(show_spinner=False, max_entries=ANALYSIS_CACHE_MAX_ENTRIES)
+def _analyze_cached(fingerprint: str, _parsed_files: List[ParsedFile]) -> AnalysisResults:
+    """
+    Analyze parsed files, cached on the fingerprint of the uploads they came from
+    
+    The parsed files themselves are excluded from the cache key (leading
+    underscore); they are fully determined by ``fingerprint``.
+    """
+    return AnalysisService.analyze_files(_parsed_files)
+
+
 def main():
     """Main application function"""
     
@@ -45,7 +97,6 @@ def main():
     st.divider()
     
     # File Upload Section (always visible)
-    from ui.components.file_upload import render_file_upload_section
     uploaded_files = render_file_upload_section()
     
     # Analyze Button
@@ -57,84 +108,68 @@ def main():
     
     # Handle Analysis
     if analyze_button and uploaded_files:
-        with st.spinner("Analyzing data... this may take a moment."):
-            try:
-                # Parse all files using service layer
-                parsed_files = []
-                for file in uploaded_files:
+        file_contents = []
+        for file in uploaded_files:
+            file_bytes = file.getvalue()
+            file_contents.append((file.name, FileService.digest_bytes(file_bytes), file_bytes))
+        fingerprint = FileService.fingerprint_files(
+            [(file_name, file_digest) for file_name, file_digest, _ in file_contents]
+        )
+        
+        previous_results = SessionRepository.get_analysis_results_native()
+        if fingerprint == SessionRepository.get_last_analysis_fingerprint() and previous_results:
+            # Same files as the last analysis: results are already in session
+            st.success(
+                f"Analysis complete! Found {previous_results.total_metrics} "
+                f"common tests across {previous_results.file_count} files."
+            )
+        else:
+            with st.spinner("Analyzing data... this may take a moment."):
+                try:
+                    # Validate and parse files concurrently (skipped on repeat uploads)
+                    workers = min(MAX_PARSE_WORKERS, len(file_contents))
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        futures = [
+                            executor.submit(
+                                _parse_cached, file_name, file_digest, PARSER_VERSION, file_bytes
+                            )
+                            for file_name, file_digest, file_bytes in file_contents
+                        ]
+                    
+                    # Collect in upload order so errors report the first failing file;
+                    # unexpected errors propagate to the handler below
+                    parsed_files = []
                     try:
-                        # Validate file
-                        FileService.validate_file(file.name, len(file.getvalue()))
-                        
-                        # Read and parse file
-                        file_content = FileService.read_file_content(file)
-                        parsed_file = ParsingService.parse_file(
-                            file.name,
-                            file_content,
-                            len(file.getvalue())
-                        )
-                        parsed_files.append(parsed_file)
+                        for (file_name, _, _), future in zip(file_contents, futures):
+                            parsed_files.append(future.result())
                     except (ValidationError, ParsingError, FileError) as e:
-                        st.error(f"Error processing file {file.name}: {str(e)}")
+                        st.error(f"Error processing file {file_name}: {str(e)}")
                         return
-                    except Exception as e:
-                        st.error(f"Unexpected error processing file {file.name}: {str(e)}")
+                    
+                    if not parsed_files:
+                        st.error("No valid files were processed.")
                         return
-                
-                if not parsed_files:
-                    st.error("No valid files were processed.")
-                    return
-                
-                # Run analysis using service layer
-                analysis_results = AnalysisService.analyze_files(parsed_files)
-                
-                # Convert to legacy format for UI compatibility
-                file_data_list = [
-                    {
-                        'name': pf.name,
-                        'data': {
-                            category: {
-                                metric: {
-                                    'value': mv.value,
-                                    'is_flagged': mv.is_flagged
-                                }
-                                for metric, mv in metrics.items()
-                            }
-                            for category, metrics in pf.data.items()
-                        }
-                    }
-                    for pf in parsed_files
-                ]
-                
-                # Convert analysis results to legacy format
-                analysis_results_dict = {
-                    category: {
-                        metric: {
-                            'values': data.values,
-                            'flags': data.flags,
-                            'delta': data.delta,
-                            'percent_change': data.percent_change,
-                            'std_dev': data.std_dev
-                        }
-                        for metric, data in result.metrics.items()
-                    }
-                    for category, result in analysis_results.results.items()
-                }
-                
-                # Store in session state
-                SessionRepository.set_file_data_list(file_data_list)
-                SessionRepository.set_analysis_results(analysis_results_dict)
-                SessionRepository.clear_selection()
-                SessionRepository.clear_interpretation()
-                
-                st.success(
-                    f"Analysis complete! Found {analysis_results.total_metrics} "
-                    f"common tests across {analysis_results.file_count} files."
-                )
-            except VNGError as e:
-                st.error(f"Analysis error: {str(e)}")
-            except Exception as e:
-                st.error(f"Unexpected error during analysis: {str(e)}")
+                    
+                    # Run analysis using service layer
+                    analysis_results = _analyze_cached(fingerprint, parsed_files)
+                    
+                    # Store domain models in session state; legacy-format views
+                    # for the UI are built on first access after this
+                    SessionRepository.set_parsed_files(parsed_files)
+                    SessionRepository.set_analysis_results_native(analysis_results)
+                    SessionRepository.set_analysis_key(fingerprint)
+                    SessionRepository.set_last_analysis_fingerprint(fingerprint)
+                    SessionRepository.clear_selection()
+                    SessionRepository.clear_interpretation()
+                    
+                    st.success(
+                        f"Analysis complete! Found {analysis_results.total_metrics} "
+                        f"common tests across {analysis_results.file_count} files."
+                    )
+                except VNGError as e:
+                    st.error(f"Analysis error: {str(e)}")
+                except Exception as e:
+                    st.error(f"Unexpected error during analysis: {str(e)}")
     
     # Results Section with Tabs
     analysis_results = SessionRepository.get_analysis_results()
@@ -158,10 +193,141 @@ def main():
             render_interpretation_section()
 
 
+# Cached chart builders
+# Figures are keyed on the analysis key plus the chart's own options; the
+# underlying data (underscore arguments) is excluded from hashing because it
+# is fully determined by the analysis key.
+
+@st.cache_data(show_spinner=False, max_entries=CHART_CACHE_MAX_ENTRIES)
+def _cached_sorted_index(
+    analysis_key: str,
+    _analysis_results: Dict
+) -> Tuple[List[str], Dict[str, List[str]]]:
+    """Sorted category names and sorted metric names per category"""
+    sorted_categories = sorted(_analysis_results.keys())
+    sorted_metrics = {
+        category: sorted(_analysis_results[category].keys())
+        for category in sorted_categories
+    }
+    return sorted_categories, sorted_metrics
+
+
+@st.cache_data(show_spinner=False, max_entries=CHART_CACHE_MAX_ENTRIES)
+def _cached_heatmap(analysis_key: str, _analysis_results: Dict, _file_data_list: List[Dict]):
+    """Build heatmap figure for the current analysis"""
+    return render_heatmap(_analysis_results, _file_data_list)
+
+
+@st.cache_data(show_spinner=False, max_entries=CHART_CACHE_MAX_ENTRIES)
+def _cached_line_chart(
+    analysis_key: str,
+    category: str,
+    metric: str,
+    show_confidence: bool,
+    _metric_data: Dict[str, Any],
+    _file_names: List[str]
+):
+    """Build enhanced line chart figure for a single metric"""
+    return render_enhanced_line_chart(
+        metric,
+        _metric_data['values'],
+        _file_names,
+        flags=_metric_data['flags'],
+        show_confidence=show_confidence
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=CHART_CACHE_MAX_ENTRIES)
+def _cached_category_chart(
+    analysis_key: str,
+    category: str,
+    _category_metrics: Dict[str, Any],
+    _file_names: List[str],
+    _file_data_list: List[Dict]
+):
+    """Build legacy category comparison figure and disclaimer flag"""
+    return render_category_chart(category, _category_metrics, _file_names, _file_data_list)
+
+
+@st.cache_data(show_spinner=False, max_entries=CHART_CACHE_MAX_ENTRIES)
+def _cached_bar_chart(
+    analysis_key: str,
+    category: str,
+    orientation: str,
+    stacked: bool,
+    show_gradients: bool,
+    _category_metrics: Dict[str, Any],
+    _file_names: List[str]
+):
+    """Build enhanced bar chart figure for a category"""
+    return render_enhanced_bar_chart(
+        category,
+        _category_metrics,
+        _file_names,
+        orientation=orientation,
+        stacked=stacked,
+        show_gradients=show_gradients
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=CHART_CACHE_MAX_ENTRIES)
+def _cached_radar_chart(analysis_key: str, category: str, _analysis_results: Dict, _file_data_list: List[Dict]):
+    """Build radar chart figure for a category"""
+    return render_radar_chart(_analysis_results, _file_data_list, category)
+
+
+@st.cache_data(show_spinner=False, max_entries=CHART_CACHE_MAX_ENTRIES)
+def _cached_box_plot(
+    analysis_key: str,
+    category: str,
+    metric: str,
+    _analysis_results: Dict,
+    _file_data_list: List[Dict]
+):
+    """Build box plot figure for a single metric"""
+    return render_box_plot(_analysis_results, _file_data_list, category, metric)
+
+
+@st.cache_data(show_spinner=False, max_entries=CHART_CACHE_MAX_ENTRIES)
+def _cached_correlation_matrix(
+    analysis_key: str,
+    category: str,
+    _analysis_results: Dict,
+    _metric_names: List[str]
+):
+    """Build correlation matrix figure for a category"""
+    # Stack into a single (n_metrics, n_files) array for np.corrcoef
+    values_matrix = np.stack([
+        _analysis_results[category][metric]['values'] for metric in _metric_names
+    ])
+    return render_correlation_matrix(values_matrix, _metric_names, category)
+
+
+@st.cache_data(show_spinner=False, max_entries=CHART_CACHE_MAX_ENTRIES)
+def _cached_multi_metric_comparison(
+    analysis_key: str,
+    category: str,
+    selected_metrics: Tuple[str, ...],
+    _analysis_results: Dict,
+    _file_data_list: List[Dict]
+):
+    """Build multi-metric comparison figure for selected metrics"""
+    return render_multi_metric_comparison(
+        _analysis_results,
+        _file_data_list,
+        category,
+        list(selected_metrics)
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=CHART_CACHE_MAX_ENTRIES)
+def _fig_to_html(fig_json: str) -> str:
+    """Build interactive HTML export for a figure, cached on its JSON"""
+    return pio.to_html(pio.from_json(fig_json), include_plotlyjs='cdn')
+
+
 def display_overview_tab(analysis_results: Dict, file_data_list: List[Dict]):
     """Display overview tab with dashboard and summary"""
-    from ui.components.dashboard import render_summary_cards, render_quick_stats
-    
     st.header("📊 Dashboard Overview")
     
     # Summary cards
@@ -178,16 +344,20 @@ def display_overview_tab(analysis_results: Dict, file_data_list: List[Dict]):
     st.subheader("🔥 Heatmap View")
     st.caption("Color-coded view of all metrics across all files")
     
-    from ui.components.charts import render_heatmap
     try:
-        heatmap_fig = render_heatmap(analysis_results, file_data_list)
+        heatmap_fig = _cached_heatmap(
+            SessionRepository.get_analysis_key(),
+            analysis_results,
+            file_data_list
+        )
         st.plotly_chart(heatmap_fig, width='stretch')
     except Exception as e:
         st.error(f"Error rendering heatmap: {str(e)}")
 
 
+@st.fragment
 def display_charts_tab(analysis_results: Dict, file_data_list: List[Dict]):
-    """Display charts tab with enhanced visualizations"""
+    """Display charts tab with enhanced visualizations (widgets rerun only this tab)"""
     st.header("📈 Charts & Visualizations")
     
     # Chart type selector
@@ -198,28 +368,38 @@ def display_charts_tab(analysis_results: Dict, file_data_list: List[Dict]):
         key="chart_type_selector"
     )
     
+    # Computed once per rerun (sorting once per analysis) and shared by all selections
+    sorted_categories, sorted_metrics = _cached_sorted_index(
+        SessionRepository.get_analysis_key(),
+        analysis_results
+    )
+    file_names = SessionRepository.get_file_names()
+    
     if chart_type == "Line Chart":
-        display_line_chart_selection(analysis_results, file_data_list)
+        display_line_chart_selection(analysis_results, sorted_categories, sorted_metrics, file_names)
     elif chart_type == "Category Comparison":
-        display_category_chart_selection(analysis_results, file_data_list)
+        display_category_chart_selection(analysis_results, file_data_list, sorted_categories, file_names)
     elif chart_type == "Radar Chart":
-        display_radar_chart_selection(analysis_results, file_data_list)
+        display_radar_chart_selection(analysis_results, file_data_list, sorted_categories)
     elif chart_type == "Box Plot":
-        display_box_plot_selection(analysis_results, file_data_list)
+        display_box_plot_selection(analysis_results, file_data_list, sorted_categories, sorted_metrics)
     elif chart_type == "Correlation Matrix":
-        display_correlation_matrix_selection(analysis_results)
+        display_correlation_matrix_selection(analysis_results, sorted_categories, sorted_metrics)
     elif chart_type == "Multi-Metric Comparison":
-        display_multi_metric_comparison(analysis_results, file_data_list)
+        display_multi_metric_comparison(analysis_results, file_data_list, sorted_categories, sorted_metrics)
 
 
+@st.fragment
 def display_detailed_analysis_tab(analysis_results: Dict, file_data_list: List[Dict]):
-    """Display detailed analysis tab with enhanced tables"""
+    """Display detailed analysis tab with enhanced tables (widgets rerun only this tab)"""
     st.header("📋 Detailed Analysis")
     
-    from ui.components.tables import render_enhanced_table
-    
     # Category filter
-    category_options = ["All Categories"] + sorted(analysis_results.keys())
+    sorted_categories, _ = _cached_sorted_index(
+        SessionRepository.get_analysis_key(),
+        analysis_results
+    )
+    category_options = ["All Categories"] + sorted_categories
     selected_category = st.selectbox(
         "Filter by Category",
         category_options,
@@ -232,18 +412,23 @@ def display_detailed_analysis_tab(analysis_results: Dict, file_data_list: List[D
     render_enhanced_table(analysis_results, file_data_list, category)
 
 
-def display_line_chart_selection(analysis_results: Dict, file_data_list: List[Dict]):
+def display_line_chart_selection(
+    analysis_results: Dict,
+    sorted_categories: List[str],
+    sorted_metrics: Dict[str, List[str]],
+    file_names: List[str]
+):
     """Display line chart selection interface"""
     # Category selection
     category = st.selectbox(
         "Select Category",
-        sorted(analysis_results.keys()),
+        sorted_categories,
         key="line_chart_category"
     )
     
     if category:
         # Metric selection
-        metrics = sorted(analysis_results[category].keys())
+        metrics = sorted_metrics[category]
         metric = st.selectbox(
             "Select Metric",
             metrics,
@@ -251,20 +436,18 @@ def display_line_chart_selection(analysis_results: Dict, file_data_list: List[Di
         )
         
         if metric:
-            from ui.components.charts import render_enhanced_line_chart
-            
             metric_data = analysis_results[category][metric]
-            file_names = [f['name'] for f in file_data_list]
             
             # Chart options
             show_confidence = st.checkbox("Show Confidence Intervals", key=f"conf_{category}_{metric}", value=False)
             
-            fig = render_enhanced_line_chart(
+            fig = _cached_line_chart(
+                SessionRepository.get_analysis_key(),
+                category,
                 metric,
-                metric_data['values'],
-                file_names,
-                flags=metric_data['flags'],
-                show_confidence=show_confidence
+                show_confidence,
+                metric_data,
+                file_names
             )
             st.plotly_chart(fig, width='stretch')
             
@@ -272,17 +455,21 @@ def display_line_chart_selection(analysis_results: Dict, file_data_list: List[Di
             export_chart_button(fig, f"line_{category}_{metric}")
 
 
-def display_category_chart_selection(analysis_results: Dict, file_data_list: List[Dict]):
+def display_category_chart_selection(
+    analysis_results: Dict,
+    file_data_list: List[Dict],
+    sorted_categories: List[str],
+    file_names: List[str]
+):
     """Display category chart selection interface"""
     category = st.selectbox(
         "Select Category",
-        sorted(analysis_results.keys()),
+        sorted_categories,
         key="category_chart_category"
     )
     
     if category:
         category_metrics = analysis_results[category]
-        file_names = [f['name'] for f in file_data_list]
         
         # Chart options
         col1, col2, col3 = st.columns(3)
@@ -295,18 +482,19 @@ def display_category_chart_selection(analysis_results: Dict, file_data_list: Lis
         
         # Use enhanced bar chart if options are selected
         if orientation == "Horizontal" or stacked or show_gradients:
-            from ui.components.charts import render_enhanced_bar_chart
-            fig = render_enhanced_bar_chart(
+            fig = _cached_bar_chart(
+                SessionRepository.get_analysis_key(),
                 category,
+                orientation.lower(),
+                stacked,
+                show_gradients,
                 category_metrics,
-                file_names,
-                orientation=orientation.lower(),
-                stacked=stacked,
-                show_gradients=show_gradients
+                file_names
             )
             show_disclaimer = len(file_data_list) > 1
         else:
-            fig, show_disclaimer = render_category_chart(
+            fig, show_disclaimer = _cached_category_chart(
+                SessionRepository.get_analysis_key(),
                 category,
                 category_metrics,
                 file_names,
@@ -325,19 +513,26 @@ def display_category_chart_selection(analysis_results: Dict, file_data_list: Lis
         export_chart_button(fig, f"category_{category}")
 
 
-def display_radar_chart_selection(analysis_results: Dict, file_data_list: List[Dict]):
+def display_radar_chart_selection(
+    analysis_results: Dict,
+    file_data_list: List[Dict],
+    sorted_categories: List[str]
+):
     """Display radar chart selection interface"""
     category = st.selectbox(
         "Select Category",
-        sorted(analysis_results.keys()),
+        sorted_categories,
         key="radar_chart_category"
     )
     
     if category:
-        from ui.components.charts import render_radar_chart
-        
         try:
-            fig = render_radar_chart(analysis_results, file_data_list, category)
+            fig = _cached_radar_chart(
+                SessionRepository.get_analysis_key(),
+                category,
+                analysis_results,
+                file_data_list
+            )
             st.plotly_chart(fig, width='stretch')
             
             # Export button
@@ -348,7 +543,12 @@ def display_radar_chart_selection(analysis_results: Dict, file_data_list: List[D
             st.error(f"Error rendering radar chart: {str(e)}")
 
 
-def display_box_plot_selection(analysis_results: Dict, file_data_list: List[Dict]):
+def display_box_plot_selection(
+    analysis_results: Dict,
+    file_data_list: List[Dict],
+    sorted_categories: List[str],
+    sorted_metrics: Dict[str, List[str]]
+):
     """Display box plot selection interface"""
     if len(file_data_list) < 3:
         st.warning("Box plots require at least 3 files for meaningful distribution analysis.")
@@ -356,12 +556,12 @@ def display_box_plot_selection(analysis_results: Dict, file_data_list: List[Dict
     
     category = st.selectbox(
         "Select Category",
-        sorted(analysis_results.keys()),
+        sorted_categories,
         key="box_plot_category"
     )
     
     if category:
-        metrics = sorted(analysis_results[category].keys())
+        metrics = sorted_metrics[category]
         metric = st.selectbox(
             "Select Metric",
             metrics,
@@ -369,10 +569,14 @@ def display_box_plot_selection(analysis_results: Dict, file_data_list: List[Dict
         )
         
         if metric:
-            from ui.components.charts import render_box_plot
-            
             try:
-                fig = render_box_plot(analysis_results, file_data_list, category, metric)
+                fig = _cached_box_plot(
+                    SessionRepository.get_analysis_key(),
+                    category,
+                    metric,
+                    analysis_results,
+                    file_data_list
+                )
                 st.plotly_chart(fig, width='stretch')
                 
                 # Export button
@@ -381,11 +585,15 @@ def display_box_plot_selection(analysis_results: Dict, file_data_list: List[Dict
                 st.error(f"Error rendering box plot: {str(e)}")
 
 
-def display_correlation_matrix_selection(analysis_results: Dict):
+def display_correlation_matrix_selection(
+    analysis_results: Dict,
+    sorted_categories: List[str],
+    sorted_metrics: Dict[str, List[str]]
+):
     """Display correlation matrix selection interface"""
     category = st.selectbox(
         "Select Category",
-        sorted(analysis_results.keys()),
+        sorted_categories,
         key="correlation_category"
     )
     
@@ -394,10 +602,13 @@ def display_correlation_matrix_selection(analysis_results: Dict):
             st.warning("Correlation matrix requires at least 2 metrics in the category.")
             return
         
-        from ui.components.charts import render_correlation_matrix
-        
         try:
-            fig = render_correlation_matrix(analysis_results, category)
+            fig = _cached_correlation_matrix(
+                SessionRepository.get_analysis_key(),
+                category,
+                analysis_results,
+                sorted_metrics[category]
+            )
             st.plotly_chart(fig, width='stretch')
             
             # Export button
@@ -406,16 +617,21 @@ def display_correlation_matrix_selection(analysis_results: Dict):
             st.error(f"Error rendering correlation matrix: {str(e)}")
 
 
-def display_multi_metric_comparison(analysis_results: Dict, file_data_list: List[Dict]):
+def display_multi_metric_comparison(
+    analysis_results: Dict,
+    file_data_list: List[Dict],
+    sorted_categories: List[str],
+    sorted_metrics: Dict[str, List[str]]
+):
     """Display multi-metric comparison interface"""
     category = st.selectbox(
         "Select Category",
-        sorted(analysis_results.keys()),
+        sorted_categories,
         key="multi_metric_category"
     )
     
     if category:
-        available_metrics = sorted(analysis_results[category].keys())
+        available_metrics = sorted_metrics[category]
         selected_metrics = st.multiselect(
             "Select Metrics to Compare (2-5 recommended)",
             available_metrics,
@@ -428,14 +644,13 @@ def display_multi_metric_comparison(analysis_results: Dict, file_data_list: List
         elif len(selected_metrics) > 10:
             st.warning("Too many metrics selected. Please select 10 or fewer for better visualization.")
         else:
-            from ui.components.charts import render_multi_metric_comparison
-            
             try:
-                fig = render_multi_metric_comparison(
-                    analysis_results,
-                    file_data_list,
+                fig = _cached_multi_metric_comparison(
+                    SessionRepository.get_analysis_key(),
                     category,
-                    selected_metrics
+                    tuple(selected_metrics),
+                    analysis_results,
+                    file_data_list
                 )
                 st.plotly_chart(fig, width='stretch')
                 
@@ -447,10 +662,8 @@ def display_multi_metric_comparison(analysis_results: Dict, file_data_list: List
 
 def export_chart_button(fig, chart_name: str):
     """Add export button for charts"""
-    import plotly.io as pio
-    
-    # HTML export (interactive)
-    html_str = pio.to_html(fig, include_plotlyjs='cdn')
+    # HTML export (interactive), built once per distinct figure
+    html_str = _fig_to_html(fig.to_json())
     st.download_button(
         label="🌐 Export HTML",
         data=html_str,
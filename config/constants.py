@@ -17,11 +17,19 @@ CHART_COLORS = [
 # File Upload Settings
 ALLOWED_FILE_TYPES = ['.txt']
 MAX_FILE_SIZE_MB = 10
+MAX_PARSE_WORKERS = 8
+PARSE_CHUNK_SIZE = 1 << 20  # 1 MiB
+PARSER_VERSION = 1  # Bump when parser output changes to invalidate cached parses
 
 # Analysis Settings
 MIN_FILES_FOR_COMPARISON = 1
 MIN_FILES_FOR_TRENDLINE = 3
 
+# Caching Settings
+CHART_CACHE_MAX_ENTRIES = 64
+ANALYSIS_CACHE_MAX_ENTRIES = 32
+PARSE_CACHE_MAX_ENTRIES = 256
+
 # AI Interpretation Settings (moved from settings for backward compatibility)
 MAX_METRICS_FOR_INTERPRETATION = 15
 
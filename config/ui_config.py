@@ -12,6 +12,7 @@ UPLOAD_INSTRUCTIONS = "Upload VNG Reports"
 UPLOAD_HELP = "IMPORTANT: Files must be plain text (.txt)"
 ANALYZE_BUTTON_TEXT = "Analyze Files"
 INTERPRET_BUTTON_TEXT = "Get AI Interpretation"
+REGENERATE_BUTTON_TEXT = "Regenerate"
 RESULTS_HEADER = "Analysis Results"
 CHART_INSTRUCTION = "Click a category or metric row in the table to see the chart."
 INTERPRETATION_SECTION_TITLE = "Clinical Interpretation"
@@ -4,7 +4,7 @@ Core business entities and data structures
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 
@@ -23,6 +23,16 @@ class MetricData:
     delta: Optional[float] = None
     percent_change: Optional[float] = None
     std_dev: Optional[float] = None
+    
+    def to_legacy_dict(self) -> Dict[str, Any]:
+        """Convert to legacy {'values', 'flags', 'delta', 'percent_change', 'std_dev'} dictionary"""
+        return {
+            'values': self.values,
+            'flags': self.flags,
+            'delta': self.delta,
+            'percent_change': self.percent_change,
+            'std_dev': self.std_dev
+        }
 
 
 @dataclass
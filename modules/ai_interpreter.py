@@ -73,7 +73,12 @@ Please provide a high-level clinical interpretation of these findings. Focus on
     return system_prompt, user_query
 
 
-def get_interpretation(api_key: str, results: Dict, num_files: int) -> Optional[str]:
+def get_interpretation(
+    api_key: str,
+    results: Dict,
+    num_files: int,
+    session: Optional[requests.Session] = None
+) -> Optional[str]:
     """
     Calls the AI API for interpretation with retry logic.
     
@@ -81,6 +86,7 @@ def get_interpretation(api_key: str, results: Dict, num_files: int) -> Optional[
         api_key: AI API key
         results: The analysis results dictionary
         num_files: Number of files being compared
+        session: Optional HTTP session to reuse connections across calls
         
     Returns:
         The interpretation text, or None if error occurred
@@ -97,13 +103,15 @@ def get_interpretation(api_key: str, results: Dict, num_files: int) -> Optional[
         },
     }
     
+    http = session if session is not None else requests
+    
     # Implement exponential backoff for retries
     max_retries = 3
     delay = 1.0  # 1 second
     
     for retry in range(max_retries):
         try:
-            response = requests.post(
+            response = http.post(
                 api_url,
                 json=payload,
                 headers={'Content-Type': 'application/json'},
@@ -4,7 +4,8 @@ Converts raw VNG report text into structured data
 """
 
 import re
-from typing import Dict, Any
+import codecs
+from typing import Dict, Any, BinaryIO, Iterable, Iterator
 
 
 def parse_vng_text(text: str) -> Dict[str, Dict[str, Dict[str, Any]]]:
@@ -14,6 +15,45 @@ def parse_vng_text(text: str) -> Dict[str, Dict[str, Dict[str, Any]]]:
     Args:
         text: The raw text content of the .txt file
         
+    Returns:
+        Structure: {category: {metric: {value: float, is_flagged: bool}}}
+        (see parse_vng_lines)
+    """
+    return parse_vng_lines(text.split('\n'))
+
+
+def iter_text_lines(fileobj: BinaryIO, chunk_size: int, encoding: str = 'utf-8') -> Iterator[str]:
+    """
+    Reads a binary file object in fixed-size chunks and yields decoded lines.
+    Only one chunk plus a partial line is held in memory at a time.
+    
+    Args:
+        fileobj: Binary file-like object positioned at the start of the content
+        chunk_size: Number of bytes to read per chunk
+        encoding: Text encoding of the content
+        
+    Yields:
+        Lines split on '\n' (same splitting as parse_vng_text)
+        
+    Raises:
+        UnicodeDecodeError: If the content is not valid in the given encoding
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    remainder = ''
+    while chunk := fileobj.read(chunk_size):
+        lines = (remainder + decoder.decode(chunk)).split('\n')
+        remainder = lines.pop()
+        yield from lines
+    yield remainder + decoder.decode(b'', final=True)
+
+
+def parse_vng_lines(lines: Iterable[str]) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    Parses the lines of a VNG file into a structured dictionary.
+    
+    Args:
+        lines: The lines of the .txt file, in order
+        
     Returns:
         A nested dictionary where:
         - Outer key: category name (e.g., "Saccades")
@@ -24,7 +64,6 @@ def parse_vng_text(text: str) -> Dict[str, Dict[str, Dict[str, Any]]]:
     """
     data_map: Dict[str, Dict[str, Dict[str, Any]]] = {}
     current_category = "General"
-    lines = text.split('\n')
     
     # Regex pattern to match: "Metric Name: 123.45 | FLAG" or "Metric Name: 123.45"
     value_regex = re.compile(r': ([\d.-]+)[\s%a-zA-Z]*?(\| FLAG)?$')
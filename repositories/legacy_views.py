@@ -0,0 +1,108 @@
+"""
+Read-only dictionary views over domain models
+Expose ParsedFile / AnalysisResults in the legacy nested-dict shape
+({category: {metric: {...}}}) without copying them into new dicts, for the
+legacy modules and UI components that still consume that shape
+"""
+
+import numpy as np
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator
+from domain.models import MetricValue, MetricData, AnalysisResults
+
+
+class _WrappedMapping(Mapping):
+    """Mapping that wraps each value of a source mapping on first access"""
+
+    def __init__(self, source: Mapping, wrap: Callable[[Any], Any]):
+        self._source = source
+        self._wrap = wrap
+        self._wrapped: Dict[Any, Any] = {}
+
+    def __getitem__(self, key):
+        try:
+            return self._wrapped[key]
+        except KeyError:
+            view = self._wrapped[key] = self._wrap(self._source[key])
+            return view
+
+    def __iter__(self) -> Iterator:
+        return iter(self._source)
+
+    def __len__(self) -> int:
+        return len(self._source)
+
+    def __contains__(self, key) -> bool:
+        return key in self._source
+
+
+class LegacyMetricView(Mapping):
+    """Legacy {'value', 'is_flagged'} view of a MetricValue"""
+
+    _KEYS = ('value', 'is_flagged')
+
+    def __init__(self, metric_value: MetricValue):
+        self._mv = metric_value
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self._mv, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._KEYS)
+
+    def __len__(self) -> int:
+        return len(self._KEYS)
+
+
+class LegacyResultView(Mapping):
+    """
+    Legacy {'values', 'flags', 'delta', 'percent_change', 'std_dev'} view of a MetricData
+    
+    'values' and 'flags' are served as numpy arrays (float64 / bool), converted
+    once per view, so chart builders can consume them without re-converting.
+    """
+
+    _KEYS = ('values', 'flags', 'delta', 'percent_change', 'std_dev')
+
+    def __init__(self, metric_data: MetricData):
+        self._md = metric_data
+        self._values = None
+        self._flags = None
+
+    def __getitem__(self, key: str) -> Any:
+        if key == 'values':
+            if self._values is None:
+                self._values = np.asarray(self._md.values, dtype=np.float64)
+            return self._values
+        if key == 'flags':
+            if self._flags is None:
+                self._flags = np.asarray(self._md.flags, dtype=bool)
+            return self._flags
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self._md, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._KEYS)
+
+    def __len__(self) -> int:
+        return len(self._KEYS)
+
+
+class LegacyFileDataView(_WrappedMapping):
+    """Legacy {category: {metric: {value, is_flagged}}} view of ParsedFile.data"""
+
+    def __init__(self, data: Dict[str, Dict[str, MetricValue]]):
+        super().__init__(data, lambda metrics: _WrappedMapping(metrics, LegacyMetricView))
+
+
+class LegacyAnalysisView(_WrappedMapping):
+    """Legacy {category: {metric: {values, flags, ...}}} view of AnalysisResults"""
+
+    def __init__(self, analysis_results: AnalysisResults):
+        super().__init__(
+            analysis_results.results,
+            lambda result: _WrappedMapping(result.metrics, LegacyResultView)
+        )
@@ -3,55 +3,137 @@ Session state repository
 Manages Streamlit session state in a centralized way
 """
 
+import requests
 import streamlit as st
 from typing import Optional, List, Dict, Any
 from domain.models import ParsedFile, AnalysisResults
+from repositories.legacy_views import LegacyFileDataView, LegacyAnalysisView
 
 
 class SessionRepository:
     """Repository for managing session state"""
     
     # Session state keys
+    KEY_PARSED_FILES = 'parsed_files'
+    KEY_ANALYSIS_RESULTS_NATIVE = 'analysis_results_native'
     KEY_FILE_DATA_LIST = 'file_data_list'
+    KEY_FILE_NAMES = 'file_names'
     KEY_ANALYSIS_RESULTS = 'analysis_results'
+    KEY_ANALYSIS_KEY = 'analysis_key'
+    KEY_LAST_ANALYSIS_FINGERPRINT = 'last_analysis_fingerprint'
     KEY_SELECTED_CATEGORY = 'selected_category'
     KEY_SELECTED_METRIC = 'selected_metric'
     KEY_INTERPRETATION_TEXT = 'interpretation_text'
+    KEY_INTERPRETATIONS = 'interpretations'
+    KEY_HTTP_SESSION = 'http_session'
     
     @staticmethod
     def initialize():
         """Initialize all session state variables"""
+        if SessionRepository.KEY_PARSED_FILES not in st.session_state:
+            st.session_state[SessionRepository.KEY_PARSED_FILES] = []
+        if SessionRepository.KEY_ANALYSIS_RESULTS_NATIVE not in st.session_state:
+            st.session_state[SessionRepository.KEY_ANALYSIS_RESULTS_NATIVE] = None
         if SessionRepository.KEY_FILE_DATA_LIST not in st.session_state:
             st.session_state[SessionRepository.KEY_FILE_DATA_LIST] = []
+        if SessionRepository.KEY_FILE_NAMES not in st.session_state:
+            st.session_state[SessionRepository.KEY_FILE_NAMES] = []
         if SessionRepository.KEY_ANALYSIS_RESULTS not in st.session_state:
             st.session_state[SessionRepository.KEY_ANALYSIS_RESULTS] = None
+        if SessionRepository.KEY_ANALYSIS_KEY not in st.session_state:
+            st.session_state[SessionRepository.KEY_ANALYSIS_KEY] = None
+        if SessionRepository.KEY_LAST_ANALYSIS_FINGERPRINT not in st.session_state:
+            st.session_state[SessionRepository.KEY_LAST_ANALYSIS_FINGERPRINT] = None
         if SessionRepository.KEY_SELECTED_CATEGORY not in st.session_state:
             st.session_state[SessionRepository.KEY_SELECTED_CATEGORY] = None
         if SessionRepository.KEY_SELECTED_METRIC not in st.session_state:
             st.session_state[SessionRepository.KEY_SELECTED_METRIC] = None
         if SessionRepository.KEY_INTERPRETATION_TEXT not in st.session_state:
             st.session_state[SessionRepository.KEY_INTERPRETATION_TEXT] = None
+        if SessionRepository.KEY_INTERPRETATIONS not in st.session_state:
+            st.session_state[SessionRepository.KEY_INTERPRETATIONS] = {}
+    
+    @staticmethod
+    def get_parsed_files() -> List[ParsedFile]:
+        """Get parsed files (domain models)"""
+        return st.session_state.get(SessionRepository.KEY_PARSED_FILES, [])
+    
+    @staticmethod
+    def set_parsed_files(parsed_files: List[ParsedFile]):
+        """Set parsed files; the legacy file data list is rebuilt on next access"""
+        st.session_state[SessionRepository.KEY_PARSED_FILES] = parsed_files
+        st.session_state[SessionRepository.KEY_FILE_DATA_LIST] = None
+        st.session_state[SessionRepository.KEY_FILE_NAMES] = [pf.name for pf in parsed_files]
+    
+    @staticmethod
+    def get_analysis_results_native() -> Optional[AnalysisResults]:
+        """Get analysis results (domain model)"""
+        return st.session_state.get(SessionRepository.KEY_ANALYSIS_RESULTS_NATIVE)
+    
+    @staticmethod
+    def set_analysis_results_native(results: Optional[AnalysisResults]):
+        """Set analysis results; the legacy results dict is rebuilt on next access"""
+        st.session_state[SessionRepository.KEY_ANALYSIS_RESULTS_NATIVE] = results
+        st.session_state[SessionRepository.KEY_ANALYSIS_RESULTS] = None
     
     @staticmethod
     def get_file_data_list() -> List[Dict[str, Any]]:
-        """Get list of parsed file data"""
-        return st.session_state.get(SessionRepository.KEY_FILE_DATA_LIST, [])
+        """Get list of parsed file data (legacy format, built from parsed files on first access)"""
+        data = st.session_state.get(SessionRepository.KEY_FILE_DATA_LIST)
+        if data is None:
+            data = [
+                {'name': pf.name, 'data': LegacyFileDataView(pf.data)}
+                for pf in SessionRepository.get_parsed_files()
+            ]
+            st.session_state[SessionRepository.KEY_FILE_DATA_LIST] = data
+        return data
     
     @staticmethod
     def set_file_data_list(data: List[Dict[str, Any]]):
         """Set list of parsed file data"""
         st.session_state[SessionRepository.KEY_FILE_DATA_LIST] = data
     
+    @staticmethod
+    def get_file_names() -> List[str]:
+        """Get names of the analyzed files, in upload order (set by set_parsed_files)"""
+        return st.session_state.get(SessionRepository.KEY_FILE_NAMES, [])
+    
     @staticmethod
     def get_analysis_results() -> Optional[Dict[str, Any]]:
-        """Get analysis results"""
-        return st.session_state.get(SessionRepository.KEY_ANALYSIS_RESULTS)
+        """Get analysis results (legacy format, built from native results on first access)"""
+        results = st.session_state.get(SessionRepository.KEY_ANALYSIS_RESULTS)
+        if results is None:
+            native = SessionRepository.get_analysis_results_native()
+            if native is not None:
+                results = LegacyAnalysisView(native)
+                st.session_state[SessionRepository.KEY_ANALYSIS_RESULTS] = results
+        return results
     
     @staticmethod
     def set_analysis_results(results: Dict[str, Any]):
         """Set analysis results"""
         st.session_state[SessionRepository.KEY_ANALYSIS_RESULTS] = results
     
+    @staticmethod
+    def get_analysis_key() -> Optional[str]:
+        """Get key identifying the current analysis results (used for caching)"""
+        return st.session_state.get(SessionRepository.KEY_ANALYSIS_KEY)
+    
+    @staticmethod
+    def set_analysis_key(key: Optional[str]):
+        """Set key identifying the current analysis results"""
+        st.session_state[SessionRepository.KEY_ANALYSIS_KEY] = key
+    
+    @staticmethod
+    def get_last_analysis_fingerprint() -> Optional[str]:
+        """Get fingerprint of the files behind the last completed analysis"""
+        return st.session_state.get(SessionRepository.KEY_LAST_ANALYSIS_FINGERPRINT)
+    
+    @staticmethod
+    def set_last_analysis_fingerprint(fingerprint: Optional[str]):
+        """Set fingerprint of the files behind the last completed analysis"""
+        st.session_state[SessionRepository.KEY_LAST_ANALYSIS_FINGERPRINT] = fingerprint
+    
     @staticmethod
     def get_selected_category() -> Optional[str]:
         """Get selected category"""
@@ -82,6 +164,30 @@ class SessionRepository:
         """Set interpretation text"""
         st.session_state[SessionRepository.KEY_INTERPRETATION_TEXT] = text
     
+    @staticmethod
+    def get_cached_interpretation(analysis_key: Optional[str]) -> Optional[str]:
+        """Get the interpretation previously generated for an analysis in this session"""
+        return st.session_state.get(SessionRepository.KEY_INTERPRETATIONS, {}).get(analysis_key)
+    
+    @staticmethod
+    def set_cached_interpretation(analysis_key: Optional[str], text: str):
+        """Remember the interpretation generated for an analysis in this session"""
+        st.session_state[SessionRepository.KEY_INTERPRETATIONS][analysis_key] = text
+    
+    @staticmethod
+    def get_http_session() -> requests.Session:
+        """
+        Get this browser session's HTTP session (created on first use)
+        
+        A browser session runs one script thread at a time, so the
+        requests.Session is never used concurrently while its connections
+        are reused across reruns.
+        """
+        session = st.session_state.get(SessionRepository.KEY_HTTP_SESSION)
+        if session is None:
+            session = st.session_state[SessionRepository.KEY_HTTP_SESSION] = requests.Session()
+        return session
+    
     @staticmethod
     def clear_selection():
         """Clear selected category and metric"""
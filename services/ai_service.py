@@ -2,6 +2,7 @@
 AI interpretation service
 """
 
+import requests
 from typing import Dict, Optional
 from domain.models import AnalysisResults
 from domain.exceptions import VNGError
@@ -14,12 +15,16 @@ class AIService:
     """Service for AI-powered interpretation"""
     
     @staticmethod
-    def get_interpretation(analysis_results: AnalysisResults) -> Optional[str]:
+    def get_interpretation(
+        analysis_results: AnalysisResults,
+        session: Optional[requests.Session] = None
+    ) -> Optional[str]:
         """
         Get AI interpretation of analysis results
         
         Args:
             analysis_results: AnalysisResults domain model
+            session: HTTP session to reuse connections across calls
             
         Returns:
             Interpretation text or None if error
@@ -33,16 +38,7 @@ class AIService:
         
         # Convert domain model to dict format for legacy function
         results_dict = {
-            category: {
-                metric: {
-                    'values': data.values,
-                    'flags': data.flags,
-                    'delta': data.delta,
-                    'percent_change': data.percent_change,
-                    'std_dev': data.std_dev
-                }
-                for metric, data in result.metrics.items()
-            }
+            category: {metric: data.to_legacy_dict() for metric, data in result.metrics.items()}
             for category, result in analysis_results.results.items()
         }
         
@@ -50,7 +46,8 @@ class AIService:
             return _get_interpretation(
                 api_key,
                 results_dict,
-                analysis_results.file_count
+                analysis_results.file_count,
+                session=session
             )
         except Exception as e:
             raise VNGError(f"Failed to get AI interpretation: {str(e)}") from e
@@ -4,6 +4,7 @@ Analysis service for VNG data
 
 from typing import Dict, List, Any
 from domain.models import ParsedFile, AnalysisResult, AnalysisResults, MetricData
+from repositories.legacy_views import LegacyFileDataView
 from domain.exceptions import AnalysisError
 from modules.analyzer import run_analysis as _run_analysis
 from utils.statistics import calculate_std_dev, calculate_percent_change
@@ -34,21 +35,9 @@ class AnalysisService:
                     total_metrics=0
                 )
             
-            # Convert to legacy format for existing analyzer
+            # Wrap in legacy-format views for existing analyzer
             file_data_list = [
-                {
-                    'name': pf.name,
-                    'data': {
-                        category: {
-                            metric: {
-                                'value': mv.value,
-                                'is_flagged': mv.is_flagged
-                            }
-                            for metric, mv in metrics.items()
-                        }
-                        for category, metrics in pf.data.items()
-                    }
-                }
+                {'name': pf.name, 'data': LegacyFileDataView(pf.data)}
                 for pf in parsed_files
             ]
             
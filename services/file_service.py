@@ -2,7 +2,9 @@
 File handling service
 """
 
-from typing import List, Optional
+import hashlib
+import xxhash
+from typing import List, Optional, Sequence, Tuple
 from domain.models import FileUploadInfo
 from domain.exceptions import FileError, ValidationError
 from config.constants import ALLOWED_FILE_TYPES, MAX_FILE_SIZE_MB
@@ -56,6 +58,37 @@ class FileService:
         except Exception as e:
             raise FileError(f"Failed to read file {uploaded_file.name}: {str(e)}") from e
     
+    @staticmethod
+    def digest_bytes(file_bytes: bytes) -> str:
+        """
+        Compute a content digest for raw file bytes
+        
+        Args:
+            file_bytes: Raw file content
+            
+        Returns:
+            xxh3-128 hex digest of the content
+        """
+        return xxhash.xxh3_128_hexdigest(file_bytes)
+    
+    @staticmethod
+    def fingerprint_files(file_digests: Sequence[Tuple[str, str]]) -> str:
+        """
+        Compute a fingerprint identifying a set of uploaded files
+        
+        Args:
+            file_digests: Sequence of (file name, content digest) in upload order
+            
+        Returns:
+            Hex digest that changes if any name, content or the order changes
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        for file_name, file_digest in file_digests:
+            hasher.update(file_name.encode('utf-8'))
+            hasher.update(b'\0')
+            hasher.update(file_digest.encode('ascii'))
+        return hasher.hexdigest()
+    
     @staticmethod
     def get_file_info(uploaded_file) -> FileUploadInfo:
         """
@@ -69,6 +102,6 @@ class FileService:
         """
         return FileUploadInfo(
             name=uploaded_file.name,
-            size_bytes=len(uploaded_file.getvalue())
+            size_bytes=uploaded_file.size
         )
 
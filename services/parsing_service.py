@@ -2,10 +2,13 @@
 Parsing service for VNG files
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, BinaryIO
 from domain.models import ParsedFile, MetricValue
-from domain.exceptions import ParsingError
+from domain.exceptions import ParsingError, FileError
 from modules.parser import parse_vng_text as _parse_vng_text
+from modules.parser import parse_vng_lines as _parse_vng_lines
+from modules.parser import iter_text_lines as _iter_text_lines
+from config.constants import PARSE_CHUNK_SIZE
 
 
 class ParsingService:
@@ -29,26 +32,66 @@ class ParsingService:
         """
         try:
             raw_data = _parse_vng_text(file_content)
+            return ParsingService._to_parsed_file(file_name, raw_data, size_bytes)
+        except Exception as e:
+            raise ParsingError(f"Failed to parse file {file_name}: {str(e)}") from e
+    
+    @staticmethod
+    def parse_stream(
+        file_name: str,
+        file_obj: BinaryIO,
+        size_bytes: int = 0,
+        chunk_size: int = PARSE_CHUNK_SIZE
+    ) -> ParsedFile:
+        """
+        Parse a VNG file from a binary file object, reading it in chunks
+        
+        Unlike parse_file, the whole decoded text is never materialized.
+        
+        Args:
+            file_name: Name of the file
+            file_obj: Binary file-like object positioned at the start of the content
+            size_bytes: Size of the file in bytes
+            chunk_size: Number of bytes to read per chunk
             
-            # Convert to domain models
-            parsed_data: Dict[str, Dict[str, MetricValue]] = {}
-            for category, metrics in raw_data.items():
-                parsed_data[category] = {
-                    metric: MetricValue(
-                        value=data['value'],
-                        is_flagged=data['is_flagged']
-                    )
-                    for metric, data in metrics.items()
-                }
+        Returns:
+            ParsedFile domain model
             
-            return ParsedFile(
-                name=file_name,
-                data=parsed_data,
-                size_bytes=size_bytes
-            )
+        Raises:
+            FileError: If the content is not valid UTF-8
+            ParsingError: If parsing fails
+        """
+        try:
+            raw_data = _parse_vng_lines(_iter_text_lines(file_obj, chunk_size))
+            return ParsingService._to_parsed_file(file_name, raw_data, size_bytes)
+        except UnicodeDecodeError as e:
+            raise FileError(f"Failed to read file {file_name}: {str(e)}") from e
         except Exception as e:
             raise ParsingError(f"Failed to parse file {file_name}: {str(e)}") from e
     
+    @staticmethod
+    def _to_parsed_file(
+        file_name: str,
+        raw_data: Dict[str, Dict[str, Dict[str, Any]]],
+        size_bytes: int
+    ) -> ParsedFile:
+        """Convert legacy parser output to a ParsedFile domain model"""
+        parsed_data: Dict[str, Dict[str, MetricValue]] = {}
+        for category, metrics in raw_data.items():
+            parsed_data[category] = {
+                metric: MetricValue(
+                    value=data['value'],
+                    is_flagged=data['is_flagged']
+                )
+                for metric, data in metrics.items()
+            }
+        
+        return ParsedFile(
+            name=file_name,
+            data=parsed_data,
+            size_bytes=size_bytes
+        )
+    
     @staticmethod
     def parse_to_dict(file_content: str) -> Dict[str, Dict[str, Dict[str, Any]]]:
         """
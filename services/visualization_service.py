@@ -51,16 +51,7 @@ class VisualizationService:
             Tuple of (Plotly figure, show_disclaimer flag)
         """
         # Convert domain models to dict format for legacy function
-        metrics_dict = {
-            metric: {
-                'values': data.values,
-                'flags': data.flags,
-                'delta': data.delta,
-                'percent_change': data.percent_change,
-                'std_dev': data.std_dev
-            }
-            for metric, data in metrics_map.items()
-        }
+        metrics_dict = {metric: data.to_legacy_dict() for metric, data in metrics_map.items()}
         
         return _render_category_chart(
             category_name,
@@ -0,0 +1,45 @@
+"""
+Tests for FileService digests and fingerprinting
+"""
+
+from services.file_service import FileService
+
+
+def _fingerprint(files):
+    return FileService.fingerprint_files(
+        [(name, FileService.digest_bytes(content)) for name, content in files]
+    )
+
+
+def test_digest_bytes_depends_on_content():
+    assert FileService.digest_bytes(b"abc") == FileService.digest_bytes(b"abc")
+    assert FileService.digest_bytes(b"abc") != FileService.digest_bytes(b"abd")
+
+
+def test_fingerprint_is_stable():
+    files = [("a.txt", b"Gain: 0.9\n"), ("b.txt", b"Gain: 0.8\n")]
+    
+    assert _fingerprint(files) == _fingerprint(list(files))
+
+
+def test_fingerprint_depends_on_order():
+    files = [("a.txt", b"Gain: 0.9\n"), ("b.txt", b"Gain: 0.8\n")]
+    
+    assert _fingerprint(files) != _fingerprint(files[::-1])
+
+
+def test_fingerprint_depends_on_name():
+    assert _fingerprint([("a.txt", b"Gain: 0.9\n")]) != _fingerprint([("b.txt", b"Gain: 0.9\n")])
+
+
+def test_fingerprint_depends_on_content():
+    assert _fingerprint([("a.txt", b"Gain: 0.9\n")]) != _fingerprint([("a.txt", b"Gain: 0.8\n")])
+
+
+def test_fingerprint_depends_on_file_boundaries():
+    digest = FileService.digest_bytes(b"")
+    
+    assert (
+        FileService.fingerprint_files([("ab", digest), ("c", digest)])
+        != FileService.fingerprint_files([("a", digest), ("bc", digest)])
+    )
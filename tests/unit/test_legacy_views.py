@@ -0,0 +1,104 @@
+"""
+Tests for legacy dictionary views over domain models
+"""
+
+from collections.abc import Mapping
+import numpy as np
+from domain.models import MetricValue, MetricData, AnalysisResult, AnalysisResults
+from repositories.legacy_views import LegacyMetricView, LegacyResultView, LegacyFileDataView, LegacyAnalysisView
+
+
+def _metric_data():
+    return MetricData(
+        values=[1.0, 2.0, 4.0],
+        flags=[False, True, False],
+        delta=3.0,
+        percent_change=300.0,
+        std_dev=1.25
+    )
+
+
+def test_metric_view_matches_legacy_dict():
+    metric_value = MetricValue(value=1.5, is_flagged=True)
+    view = LegacyMetricView(metric_value)
+    
+    assert isinstance(view, Mapping)
+    assert dict(view) == {'value': 1.5, 'is_flagged': True}
+    assert list(view) == ['value', 'is_flagged']
+    assert len(view) == 2
+    assert 'value' in view and 'values' not in view
+    assert view.get('missing') is None
+
+
+def test_result_view_serves_numpy_arrays():
+    view = LegacyResultView(_metric_data())
+    
+    values = view['values']
+    flags = view['flags']
+    
+    assert isinstance(values, np.ndarray) and values.dtype == np.float64
+    assert isinstance(flags, np.ndarray) and flags.dtype == bool
+    np.testing.assert_array_equal(values, [1.0, 2.0, 4.0])
+    np.testing.assert_array_equal(flags, [False, True, False])
+    # Converted once per view
+    assert view['values'] is values
+    assert view['flags'] is flags
+
+
+def test_result_view_matches_legacy_dict():
+    metric_data = _metric_data()
+    view = LegacyResultView(metric_data)
+    legacy = metric_data.to_legacy_dict()
+    
+    assert list(view) == list(legacy)
+    assert len(view) == len(legacy)
+    for key in ('delta', 'percent_change', 'std_dev'):
+        assert view[key] == legacy[key]
+    assert view.get('missing') is None
+
+
+def test_file_data_view_is_nested_mapping():
+    data = {
+        'Saccades': {
+            'Latency': MetricValue(value=200.0),
+            'Accuracy': MetricValue(value=90.0, is_flagged=True)
+        },
+        'Pursuit': {'Gain': MetricValue(value=0.9)}
+    }
+    view = LegacyFileDataView(data)
+    
+    assert list(view) == ['Saccades', 'Pursuit']
+    assert len(view) == 2
+    assert 'Pursuit' in view and 'Optokinetic' not in view
+    assert list(view['Saccades']) == ['Latency', 'Accuracy']
+    assert view['Saccades']['Accuracy']['is_flagged'] is True
+    assert {
+        category: {metric: dict(mv) for metric, mv in metrics.items()}
+        for category, metrics in view.items()
+    } == {
+        category: {
+            metric: {'value': mv.value, 'is_flagged': mv.is_flagged}
+            for metric, mv in metrics.items()
+        }
+        for category, metrics in data.items()
+    }
+    # Child views are memoized
+    assert view['Saccades'] is view['Saccades']
+    assert view['Saccades']['Latency'] is view['Saccades']['Latency']
+
+
+def test_analysis_view_wraps_results():
+    results = AnalysisResults(
+        results={
+            'Saccades': AnalysisResult(category='Saccades', metrics={'Latency': _metric_data()})
+        },
+        file_count=3,
+        total_metrics=1
+    )
+    view = LegacyAnalysisView(results)
+    
+    assert list(view) == ['Saccades']
+    assert list(view['Saccades']) == ['Latency']
+    assert view['Saccades']['Latency']['delta'] == 3.0
+    np.testing.assert_array_equal(view['Saccades']['Latency']['values'], [1.0, 2.0, 4.0])
+    assert view['Saccades'] is view['Saccades']
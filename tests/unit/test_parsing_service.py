@@ -0,0 +1,67 @@
+"""
+Tests for ParsingService streamed parsing
+"""
+
+import io
+import pytest
+from services.parsing_service import ParsingService
+from domain.exceptions import FileError
+from config.constants import PARSE_CHUNK_SIZE
+
+
+SAMPLE_TEXT = (
+    "VISUOMOTOR //:\n"
+    "Saccades:\n"
+    "Latency (ms): 200 ms\n"
+    "Précision: 90 % | FLAG\n"
+    "Vélocité → droite: 400\n"
+    "Pursuit 👁:\n"
+    "Gain: 0.9\r\n"
+    "Symmetry: -5\n"
+    "Summary of Flagged Findings:\n"
+    "Asymétrie µ: 12.5"
+)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, PARSE_CHUNK_SIZE])
+def test_parse_stream_matches_parse_file(chunk_size):
+    content = SAMPLE_TEXT.encode('utf-8')
+    
+    expected = ParsingService.parse_file("a.txt", SAMPLE_TEXT, len(content))
+    parsed = ParsingService.parse_stream("a.txt", io.BytesIO(content), len(content), chunk_size)
+    
+    assert parsed.data == expected.data
+    assert parsed.name == expected.name
+    assert parsed.size_bytes == expected.size_bytes
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, PARSE_CHUNK_SIZE])
+def test_parse_stream_keeps_non_ascii_names(chunk_size):
+    content = SAMPLE_TEXT.encode('utf-8')
+    
+    parsed = ParsingService.parse_stream("a.txt", io.BytesIO(content), len(content), chunk_size)
+    
+    assert parsed.data["Saccades"]["Précision"].is_flagged
+    assert parsed.data["Saccades"]["Vélocité → droite"].value == 400.0
+    assert parsed.data["Pursuit 👁"]["Asymétrie µ"].value == 12.5
+
+
+def test_parse_stream_empty_content():
+    parsed = ParsingService.parse_stream("a.txt", io.BytesIO(b""))
+    
+    assert parsed.data == {}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, PARSE_CHUNK_SIZE])
+def test_parse_stream_invalid_utf8_raises_file_error(chunk_size):
+    content = "Saccades:\nLatency: 200\n".encode('utf-8') + b"\xff\xfe: 1\n"
+    
+    with pytest.raises(FileError, match="bad.txt"):
+        ParsingService.parse_stream("bad.txt", io.BytesIO(content), len(content), chunk_size)
+
+
+def test_parse_stream_truncated_multibyte_raises_file_error():
+    content = "Gain: 0.9\né".encode('utf-8')[:-1]
+    
+    with pytest.raises(FileError):
+        ParsingService.parse_stream("bad.txt", io.BytesIO(content), len(content), 3)
@@ -2,13 +2,15 @@
 Enhanced chart components with additional visualization types
 """
 
+import warnings
 import streamlit as st
+import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
-from typing import Dict, List, Any, Optional
-import pandas as pd
+from typing import Dict, List, Any, Optional, Sequence
 from modules.visualizer import render_line_chart, render_category_chart
+from utils.statistics import calculate_linear_regression, calculate_percent_change
 from config.constants import CHART_COLORS
 
 
@@ -121,7 +123,7 @@ def render_enhanced_line_chart(
     metric_name: str,
     values: List[float],
     file_names: List[str],
-    flags: Optional[List[bool]] = None,
+    flags: Optional[Sequence[bool]] = None,
     show_confidence: bool = False
 ) -> go.Figure:
     """
@@ -147,15 +149,15 @@ def render_enhanced_line_chart(
         name=metric_name,
         line=dict(color='rgba(59, 130, 246, 1)', width=3),
         marker=dict(
-            color=['red' if (flags and flags[i]) else 'rgba(59, 130, 246, 1)' 
+            color=['red' if (flags is not None and flags[i]) else 'rgba(59, 130, 246, 1)' 
                    for i in range(len(values))],
             size=10,
-            symbol=['x' if (flags and flags[i]) else 'circle' for i in range(len(values))]
+            symbol=['x' if (flags is not None and flags[i]) else 'circle' for i in range(len(values))]
         )
     ))
     
     # Add annotations for flagged values
-    if flags:
+    if flags is not None:
         for i, (val, is_flag) in enumerate(zip(values, flags)):
             if is_flag:
                 fig.add_annotation(
@@ -173,7 +175,6 @@ def render_enhanced_line_chart(
     
     # Add confidence intervals if requested and 3+ files
     if show_confidence and len(values) >= 3:
-        import numpy as np
         mean_val = np.mean(values)
         std_val = np.std(values, ddof=1)
         upper_bound = [mean_val + 1.96 * std_val] * len(values)
@@ -203,7 +204,6 @@ def render_enhanced_line_chart(
     
     # Add trendline if 3+ files
     if len(values) >= 3:
-        from utils.statistics import calculate_linear_regression
         trendline_data = calculate_linear_regression(values)
         fig.add_trace(go.Scatter(
             x=file_names,
@@ -273,39 +273,29 @@ def render_box_plot(
 
 
 def render_correlation_matrix(
-    analysis_results: Dict[str, Any],
+    values_matrix: np.ndarray,
+    metric_names: List[str],
     category: str
 ) -> go.Figure:
     """
     Render correlation matrix showing relationships between metrics in a category
     
     Args:
-        analysis_results: Analysis results dictionary
-        category: Category to analyze
+        values_matrix: Array of shape (n_metrics, n_files), one row per metric
+        metric_names: Metric names, in the same order as the rows
+        category: Category name (for the title)
         
     Returns:
         Plotly figure
     """
-    if category not in analysis_results:
-        raise ValueError(f"Category {category} not found")
-    
-    category_metrics = analysis_results[category]
-    
-    if len(category_metrics) < 2:
+    if len(metric_names) < 2:
         raise ValueError("Correlation matrix requires at least 2 metrics")
     
-    # Prepare data for correlation
-    metric_names = []
-    values_matrix = []
-    
-    for metric in sorted(category_metrics.keys()):
-        metric_names.append(metric)
-        values_matrix.append(category_metrics[metric]['values'])
-    
-    # Calculate correlation matrix
-    import numpy as np
-    df = pd.DataFrame(values_matrix, index=metric_names).T
-    corr_matrix = df.corr().values
+    # Calculate correlation matrix (rows are variables); constant metrics or
+    # a single file yield NaN entries, as before
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        corr_matrix = np.corrcoef(values_matrix)
     
     # Create heatmap
     fig = go.Figure(data=go.Heatmap(
@@ -442,8 +432,6 @@ def render_enhanced_bar_chart(
             ))
     else:
         # Multiple files - show percent change
-        from utils.statistics import calculate_percent_change
-        
         for file_index in range(1, num_files):
             data_for_this_file = []
             
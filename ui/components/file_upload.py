@@ -52,7 +52,7 @@ def render_file_upload_section() -> List[Any]:
                     with col1:
                         # Validate file
                         try:
-                            FileService.validate_file(file.name, len(file.getvalue()))
+                            FileService.validate_file(file_info.name, file_info.size_bytes)
                             st.success("✓ Valid file")
                         except ValidationError as e:
                             st.error(f"✗ {str(e)}")
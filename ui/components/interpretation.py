@@ -9,14 +9,14 @@ from repositories.session_repository import SessionRepository
 from config.settings import settings
 from config.ui_config import (
     INTERPRETATION_SECTION_TITLE, INTERPRETATION_DESCRIPTION,
-    INTERPRET_BUTTON_TEXT, INTERPRETATION_LOADING
+    INTERPRET_BUTTON_TEXT, REGENERATE_BUTTON_TEXT, INTERPRETATION_LOADING
 )
 from domain.exceptions import VNGError
-from domain.models import AnalysisResults, AnalysisResult, MetricData
 
 
+@st.fragment
 def render_interpretation_section():
-    """Render enhanced AI interpretation section"""
+    """Render enhanced AI interpretation section (widgets rerun only this section)"""
     st.header(f"🤖 {INTERPRETATION_SECTION_TITLE}")
     st.write(INTERPRETATION_DESCRIPTION)
     
@@ -31,11 +31,14 @@ AI_API_KEY = "your-api-key-here"
         """)
         return
     
-    # Interpretation button
+    # Interpretation buttons
     col1, col2 = st.columns([1, 4])
     with col1:
         if st.button(INTERPRET_BUTTON_TEXT, type="primary"):
             get_interpretation()
+    with col2:
+        if SessionRepository.get_interpretation_text() and st.button(REGENERATE_BUTTON_TEXT):
+            get_interpretation(force_refresh=True)
     
     # Display interpretation if available
     interpretation_text = SessionRepository.get_interpretation_text()
@@ -56,44 +59,36 @@ AI_API_KEY = "your-api-key-here"
         )
 
 
-def get_interpretation():
-    """Get AI interpretation of analysis results"""
+def get_interpretation(force_refresh: bool = False):
+    """
+    Get AI interpretation of analysis results
+    
+    Args:
+        force_refresh: Skip the interpretation already generated for this
+            analysis in the session and request a new one
+    """
     with st.spinner(INTERPRETATION_LOADING):
         try:
-            # Get analysis results and convert to domain model
-            analysis_results_dict = SessionRepository.get_analysis_results()
-            file_data_list = SessionRepository.get_file_data_list()
+            analysis_results = SessionRepository.get_analysis_results_native()
             
-            if not analysis_results_dict or not file_data_list:
+            if not analysis_results:
                 st.error("No analysis results available. Please analyze files first.")
                 return
             
-            # Convert to domain model for service
-            results = {
-                category: AnalysisResult(
-                    category=category,
-                    metrics={
-                        metric: MetricData(
-                            values=data['values'],
-                            flags=data['flags'],
-                            delta=data['delta'],
-                            percent_change=data['percent_change'],
-                            std_dev=data['std_dev']
-                        )
-                        for metric, data in metrics.items()
-                    }
-                )
-                for category, metrics in analysis_results_dict.items()
-            }
-            
-            analysis_results = AnalysisResults(
-                results=results,
-                file_count=len(file_data_list),
-                total_metrics=sum(len(m) for m in analysis_results_dict.values())
-            )
+            # Repeat requests for the same analysis reuse the session's copy
+            analysis_key = SessionRepository.get_analysis_key()
+            interpretation = None
+            if not force_refresh:
+                interpretation = SessionRepository.get_cached_interpretation(analysis_key)
             
-            # Get interpretation using service
-            interpretation = AIService.get_interpretation(analysis_results)
+            if interpretation is None:
+                # Get interpretation using service
+                interpretation = AIService.get_interpretation(
+                    analysis_results,
+                    session=SessionRepository.get_http_session()
+                )
+                if interpretation:
+                    SessionRepository.set_cached_interpretation(analysis_key, interpretation)
             
             if interpretation:
                 SessionRepository.set_interpretation_text(interpretation)